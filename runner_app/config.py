@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any, Dict
+import os
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-from .paths import CONFIG_PATH
+from .paths import CONFIG_PATH, ensure_dirs
 
-DEFAULT_CONFIG: Dict[str, Any] = {
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_DEFAULTS: Dict[str, Any] = {
     "theme": "dark",
     "history": [],
     "external_console": False,
@@ -14,27 +22,61 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "interpreter_profiles": [],
     "active_profile": None,
     "fallback_python": "",
+    "max_output_lines": 20000,
 }
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(_DEFAULTS)
+
+# Digest of the bytes last read from or written to disk, used to skip no-op saves.
+_last_digest: bytes | None = None
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _serialize(config: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
+def _deserialize(payload: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 
 def load_config() -> Dict[str, Any]:
+    global _last_digest
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except FileNotFoundError:
-        return DEFAULT_CONFIG.copy()
+        with open(CONFIG_PATH, "rb") as handle:
+            payload = handle.read()
+        data = _deserialize(payload)
     except Exception:
-        return DEFAULT_CONFIG.copy()
+        return dict(DEFAULT_CONFIG)
+    if not isinstance(data, dict):
+        # Valid JSON that is not an object cannot be merged over the defaults.
+        return dict(DEFAULT_CONFIG)
 
-    merged = DEFAULT_CONFIG.copy()
-    merged.update(data)
-    return merged
+    _last_digest = _digest(payload)
+    return {**DEFAULT_CONFIG, **data}
 
 
 def save_config(config: Dict[str, Any]) -> None:
+    global _last_digest
     try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as handle:
-            json.dump(config, handle, indent=2)
+        payload = _serialize(config)
+        digest = _digest(payload)
+        if digest == _last_digest:
+            return
+        ensure_dirs()
+        temp_path = f"{CONFIG_PATH}.tmp"
+        with open(temp_path, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, CONFIG_PATH)
+        _last_digest = digest
     except Exception:
         # Persisting config failures should not crash the UI.
         pass
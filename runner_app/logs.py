@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import re
+from itertools import product
+from typing import List
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+LOG_TAG_RE = re.compile(rb"(error|exception|traceback)|(warning)|(success|done)", re.IGNORECASE)
+LOG_TAG_LABELS = ("error", "warning", "success")
+# Every casing of ".log", so suffix checks need no lowercased copy of the name.
+LOG_SUFFIXES = tuple("." + "".join(chars) for chars in product("lL", "oO", "gG"))
+
+
+def classify_log(path: str) -> str:
+    # A raw descriptor read skips the buffered file object for a 4 KB header.
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            head = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return "other"
+    if not head:
+        return "other"
+
+    # Groups are ordered by precedence; an error anywhere wins outright.
+    best = len(LOG_TAG_LABELS) + 1
+    for match in LOG_TAG_RE.finditer(head):
+        if match.lastindex == 1:
+            return LOG_TAG_LABELS[0]
+        best = min(best, match.lastindex)
+    return LOG_TAG_LABELS[best - 1] if best <= len(LOG_TAG_LABELS) else "other"
+
+
+class TaskSignals(QObject):
+    """Signals for pool tasks; unparented, so closing the window cannot delete them mid-task."""
+
+    finished = Signal(object)
+    failed = Signal(str, str)
+
+
+class LogScanTask(QRunnable):
+    """Classifies log files on a pool thread.
+
+    Emits ``finished`` with a list of ``(path, mtime, size, category)`` tuples.
+    """
+
+    def __init__(self, files: List[tuple[str, float, int]]) -> None:
+        super().__init__()
+        self.signals = TaskSignals()
+        self._files = files
+
+    def run(self) -> None:
+        results = [(path, mtime, size, classify_log(path)) for path, mtime, size in self._files]
+        self.signals.finished.emit(results)
+
+
+class LogWriteTask(QRunnable):
+    """Writes console text to a log file on a pool thread.
+
+    Emits ``finished`` with the path on success and ``failed`` with the path and
+    error text otherwise.
+    """
+
+    def __init__(self, path: str, text: str) -> None:
+        super().__init__()
+        self.signals = TaskSignals()
+        self._path = path
+        self._text = text
+
+    def run(self) -> None:
+        text = self._text if os.linesep == "\n" else self._text.replace("\n", os.linesep)
+        try:
+            # Encode once; a buffered binary write always consumes the whole payload.
+            with open(self._path, "wb") as handle:
+                handle.write(text.encode("utf-8"))
+        except OSError as error:
+            self.signals.failed.emit(self._path, str(error))
+        else:
+            self.signals.finished.emit(self._path)
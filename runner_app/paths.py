@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import functools
 import os
 import sys
 
 APP_DIR = os.path.join(os.path.expanduser("~"), ".script_runner")
 CONFIG_PATH = os.path.join(APP_DIR, "config.json")
 LOG_DIR = os.path.join(APP_DIR, "logs")
+RESOURCE_BASE = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
 
-os.makedirs(APP_DIR, exist_ok=True)
-os.makedirs(LOG_DIR, exist_ok=True)
 
+@functools.cache
+def ensure_dirs() -> None:
+    """Create the config and log directories once per process.
 
+    Called lazily before the first write, so launches that never save touch
+    nothing on disk.
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=64)
 def resource_path(relative_path: str) -> str:
     """Resolve resource paths that work for PyInstaller bundles and dev runs."""
-    base = getattr(sys, "_MEIPASS", os.path.abspath("."))
-    return os.path.join(base, relative_path)
+    return os.path.join(RESOURCE_BASE, relative_path)
@@ -1,9 +1,25 @@
 from __future__ import annotations
 
-import datetime as dt
+import codecs
+import os
+import re
+import signal
+import time
 from typing import Optional
 
-from PySide6.QtCore import QProcess, QObject, Signal
+from PySide6.QtCore import QProcess, QObject, Qt, QTimer, Signal, Slot
+
+# Matches the start of every line except an empty trailing one.
+_LINE_START = re.compile(r"^(?!\Z)", re.MULTILINE)
+# The same, minus the start of the chunk, for chunks that continue a line.
+_NEXT_LINE_START = re.compile(r"(?<=\n)(?!\Z)")
+
+# Output is coalesced for this many milliseconds before being emitted.
+FLUSH_INTERVAL_MS = 16
+# Pending chunks beyond this count are flushed without waiting for the timer.
+FLUSH_THRESHOLD = 64
+# A stopped script gets this long to exit on SIGTERM before it is killed.
+TERMINATE_GRACE_MS = 3000
 
 
 class ScriptProcess(QObject):
@@ -17,9 +33,37 @@ class ScriptProcess(QObject):
         super().__init__(parent)
         self._process = QProcess(self)
         self._process.setProcessChannelMode(QProcess.MergedChannels)
-        self._process.readyReadStandardOutput.connect(self._handle_output)
-        self._process.errorOccurred.connect(self._handle_error)
-        self._process.finished.connect(self._forward_finished)
+        # Scripts lead their own session on POSIX so stopping one also reaches
+        # the processes it spawned. Needs Qt 6.6; older builds signal the child only.
+        self._own_session = False
+        flags = getattr(QProcess, "UnixProcessFlag", None)
+        if os.name == "posix" and flags is not None and hasattr(self._process, "setUnixProcessParameters"):
+            self._process.setUnixProcessParameters(flags.CreateNewSession)
+            self._own_session = True
+        # The QProcess lives on this object's thread, so dispatch slots directly.
+        self._process.readyReadStandardOutput.connect(self._handle_output, Qt.DirectConnection)
+        self._process.errorOccurred.connect(self._handle_error, Qt.DirectConnection)
+        self._process.finished.connect(self._forward_finished, Qt.DirectConnection)
+
+        self._buffer: list[str] = []
+        # Whether the next chunk begins a new line; writes can end mid-line.
+        self._at_line_start = True
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush, Qt.DirectConnection)
+
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.setInterval(TERMINATE_GRACE_MS)
+        self._kill_timer.timeout.connect(self._kill, Qt.DirectConnection)
+
+        # Multibyte sequences split across reads are completed on the next read.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        # The prefix only changes once per second, so reuse it between reads.
+        self._stamp_second = -1
+        self._stamp_text = ""
 
     @property
     def qprocess(self) -> QProcess:
@@ -30,26 +74,93 @@ class ScriptProcess(QObject):
             self._process.setWorkingDirectory(working_dir)
         self._process.setProgram(program)
         self._process.setArguments(arguments)
+        self.reset()
         self._process.start()
 
+    def reset(self) -> None:
+        """Drop leftovers from a previous run so the wrapper can be reused."""
+        self._flush_timer.stop()
+        self._kill_timer.stop()
+        self._buffer.clear()
+        self._at_line_start = True
+        self._decoder.reset()
+
     def write(self, text: str) -> None:
         self._process.write(text.encode())
 
     def terminate(self) -> None:
-        self._process.kill()
+        """Ask the script to exit, killing it if it is still running after the grace period."""
+        if not self.is_running():
+            return
+        if os.name == "nt":
+            # Console programs ignore the WM_CLOSE that terminate() posts on Windows.
+            self._process.kill()
+            return
+        if not self._signal_group(signal.SIGTERM):
+            self._process.terminate()
+        self._kill_timer.start()
+
+    @Slot()
+    def _kill(self) -> None:
+        if self.is_running():
+            self._signal_group(signal.SIGKILL)
+            self._process.kill()
+
+    def _signal_group(self, signum: int) -> bool:
+        pid = self._process.processId()
+        if not self._own_session or pid <= 0:
+            return False
+        try:
+            os.killpg(pid, signum)
+        except OSError:
+            return False
+        return True
 
     def is_running(self) -> bool:
         return self._process.state() != QProcess.NotRunning
 
+    @Slot()
     def _handle_output(self) -> None:
-        data = self._process.readAllStandardOutput()
-        line = bytes(data).decode(errors="replace")
-        timestamp = dt.datetime.now().strftime("[%H:%M:%S] ")
-        self.output_ready.emit("".join(f"{timestamp}{segment}" for segment in line.splitlines(True)))
+        data = self._process.readAllStandardOutput().data()
+        self._queue_text(self._decoder.decode(data))
+
+    def _queue_text(self, line: str) -> None:
+        if not line:
+            return
+        timestamp = self._timestamp()
+        pattern = _LINE_START if self._at_line_start else _NEXT_LINE_START
+        self._buffer.append(pattern.sub(timestamp, line))
+        self._at_line_start = line.endswith("\n")
+        if len(self._buffer) >= FLUSH_THRESHOLD:
+            self._flush()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _timestamp(self) -> str:
+        second = int(time.time())
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp_text = time.strftime("[%H:%M:%S] ", time.localtime(second))
+        return self._stamp_text
+
+    @Slot()
+    def _flush(self) -> None:
+        self._flush_timer.stop()
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self.output_ready.emit(text)
 
+    @Slot(QProcess.ProcessError)
     def _handle_error(self, err: QProcess.ProcessError) -> None:
+        self._flush()
         message = self._process.errorString()
         self.error.emit(err, message)
 
+    @Slot(int, QProcess.ExitStatus)
     def _forward_finished(self, exit_code: int, status: QProcess.ExitStatus) -> None:
+        self._kill_timer.stop()
+        self._queue_text(self._decoder.decode(b"", final=True))
+        self._flush()
         self.finished.emit(exit_code, status)
@@ -19,7 +19,7 @@ from PySide6.QtWidgets import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InterpreterProfile:
     name: str
     command: str
@@ -46,10 +46,8 @@ class SettingsDialog(QDialog):
         self.setModal(True)
 
         self._config = config
-        self._profiles = [
-            InterpreterProfile.from_dict(item)
-            for item in config.get("interpreter_profiles", [])
-        ]
+        # Raw profile dicts; InterpreterProfile objects are built only when a row is edited.
+        self._profile_dicts: List[Dict[str, Any]] = list(config.get("interpreter_profiles", []))
         self._clear_history = False
         self._clear_logs = False
 
@@ -119,19 +117,19 @@ class SettingsDialog(QDialog):
 
     def _refresh_profile_list(self, selected: int | None = None) -> None:
         self.profile_list.clear()
-        for profile in self._profiles:
-            QListWidgetItem(profile.name, self.profile_list)
-        if selected is not None and 0 <= selected < len(self._profiles):
+        for data in self._profile_dicts:
+            QListWidgetItem(data.get("name", "Custom"), self.profile_list)
+        if selected is not None and 0 <= selected < len(self._profile_dicts):
             self.profile_list.setCurrentRow(selected)
 
     def _load_selected_profile(self) -> None:
         index = self.profile_list.currentRow()
-        if index < 0 or index >= len(self._profiles):
+        if index < 0 or index >= len(self._profile_dicts):
             self.profile_name.clear()
             self.profile_command.clear()
             self.profile_args.clear()
             return
-        profile = self._profiles[index]
+        profile = InterpreterProfile.from_dict(self._profile_dicts[index])
         self.profile_name.setText(profile.name)
         self.profile_command.setText(profile.command)
         self.profile_args.setText(" ".join(profile.arguments))
@@ -141,19 +139,22 @@ class SettingsDialog(QDialog):
         profile = self._capture_profile_fields()
         if not profile:
             return
-        if 0 <= selection < len(self._profiles):
-            self._profiles[selection] = profile
-            target = selection
+        if 0 <= selection < len(self._profile_dicts):
+            self._profile_dicts[selection] = profile.to_dict()
+            self.profile_list.item(selection).setText(profile.name)
         else:
-            self._profiles.append(profile)
-            target = len(self._profiles) - 1
-        self._refresh_profile_list(target)
+            self._profile_dicts.append(profile.to_dict())
+            QListWidgetItem(profile.name, self.profile_list)
+            self.profile_list.setCurrentRow(len(self._profile_dicts) - 1)
 
     def _delete_profile(self) -> None:
         selection = self.profile_list.currentRow()
-        if 0 <= selection < len(self._profiles):
-            self._profiles.pop(selection)
-            self._refresh_profile_list()
+        if 0 <= selection < len(self._profile_dicts):
+            self._profile_dicts.pop(selection)
+            self.profile_list.blockSignals(True)
+            self.profile_list.takeItem(selection)
+            self.profile_list.setCurrentRow(-1)
+            self.profile_list.blockSignals(False)
             self.profile_name.clear()
             self.profile_command.clear()
             self.profile_args.clear()
@@ -176,10 +177,10 @@ class SettingsDialog(QDialog):
         profile = self._capture_profile_fields()
         if profile:
             selection = self.profile_list.currentRow()
-            if 0 <= selection < len(self._profiles):
-                self._profiles[selection] = profile
+            if 0 <= selection < len(self._profile_dicts):
+                self._profile_dicts[selection] = profile.to_dict()
             else:
-                self._profiles.append(profile)
+                self._profile_dicts.append(profile.to_dict())
         self.accept()
 
     def result_config(self) -> tuple[Dict[str, Any], Dict[str, bool]]:
@@ -187,7 +188,7 @@ class SettingsDialog(QDialog):
             "theme": "dark" if self.theme_checkbox.isChecked() else "light",
             "external_console": self.console_checkbox.isChecked(),
             "auto_run": self.autorun_checkbox.isChecked(),
-            "interpreter_profiles": [profile.to_dict() for profile in self._profiles],
+            "interpreter_profiles": list(self._profile_dicts),
             "fallback_python": self.python_path_edit.text().strip(),
         }
         tasks = {"clear_history": self._clear_history, "clear_logs": self._clear_logs}
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import sys
 import os
+import re
 import shlex
-from functools import partial
-from typing import Dict, List, Optional
+import shutil
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, TextIO
 import subprocess
-
-from PySide6.QtCore import Qt, QTimer, QUrl, QStringListModel, QProcess
-from PySide6.QtGui import QDesktopServices, QFont, QIcon, QKeySequence, QShortcut, QTextCursor
+from contextlib import contextmanager
+import time
+
+from PySide6.QtCore import (
+    QFileSystemWatcher,
+    QMetaObject,
+    QModelIndex,
+    QProcess,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Slot,
+)
+from PySide6.QtGui import (
+    QDesktopServices,
+    QFont,
+    QIcon,
+    QKeySequence,
+    QShortcut,
+    QStandardItem,
+    QStandardItemModel,
+    QTextCursor,
+)
 from PySide6.QtWidgets import (
+    QApplication,
     QComboBox,
     QFileDialog,
     QFrame,
@@ -18,8 +44,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMenu,
     QPushButton,
     QCompleter,
@@ -33,9 +58,11 @@ from PySide6.QtWidgets import (
 
 from ..config import load_config, save_config
 from ..highlighting import LogHighlighter
-from ..paths import LOG_DIR, resource_path
+from ..logs import LOG_SUFFIXES, LogScanTask, LogWriteTask, classify_log
+from ..paths import LOG_DIR, ensure_dirs, resource_path
 from ..process import ScriptProcess
 from ..settings import SettingsDialog, InterpreterProfile
+from .models import HistoryFilterModel, HistoryModel, LogModel
 from .theme import build_stylesheet
 
 COMMON_ARGUMENTS = [
@@ -50,8 +77,9 @@ COMMON_ARGUMENTS = [
     "--limit",
     "--env",
 ]
+_COMMON_ARGUMENT_SET = frozenset(COMMON_ARGUMENTS)
 
-COMMAND_TEMPLATES: Dict[str, List[tuple[str, str]]] = {
+_RAW_TEMPLATES: Dict[str, List[tuple[str, str]]] = {
     "Python": [
         ("Data analysis (pandas)", "--input data.csv --summary report.json"),
         ("Web scraping", "--url https://example.com --depth 2 --export output.json"),
@@ -70,8 +98,106 @@ COMMAND_TEMPLATES: Dict[str, List[tuple[str, str]]] = {
         ("Build project", "npm run build"),
     ],
 }
+COMMAND_TEMPLATES: Mapping[str, tuple[tuple[str, str], ...]] = MappingProxyType(
+    {name: tuple(entries) for name, entries in _RAW_TEMPLATES.items()}
+)
 
 HISTORY_TIMESTAMP_FMT = "%Y-%m-%d %H:%M:%S"
+HISTORY_FILTER_DELAY_MS = 250
+ARGUMENT_VALIDATION_DELAY_MS = 150
+CONFIG_FLUSH_DELAY_MS = 500
+LOG_WATCH_DELAY_MS = 200
+OUTPUT_MAX_BLOCKS = 20000
+OUTPUT_FLUSH_INTERVAL_MS = 33
+# Longer console lines are split into blocks of this size to bound layout and highlighting.
+OUTPUT_MAX_LINE_CHARS = 4096
+# Anchored at line starts so a miss costs one pass instead of a rescan per character.
+_OVERLONG_LINE_RE = re.compile(f"^[^\\n]{{{OUTPUT_MAX_LINE_CHARS + 1}}}", re.MULTILINE)
+LIVE_LOG_BUFFER_SIZE = 1 << 18
+# Buffered live-log output reaches the disk at least this often while a script writes.
+LIVE_LOG_FLUSH_INTERVAL_MS = 1000
+# Refreshes with more unclassified logs than this classify them on the thread pool.
+LOG_SCAN_SYNC_LIMIT = 20
+
+# Checked in this order rather than by position, so "sh" in a directory name such
+# as /home/joshua/.venv/bin/python cannot win over the interpreter itself.
+_SHEBANG_INTERPRETERS = (
+    ("python", "Python"),
+    ("node", "Node.js"),
+    ("bash", "Bash"),
+    ("sh", "Bash"),
+)
+_EXTENSION_INTERPRETERS = {
+    ".py": "Python",
+    ".sh": "Bash",
+    ".ps1": "PowerShell",
+    ".js": "Node.js",
+    ".bat": "Bash",
+}
+SCRIPT_EXTENSIONS = tuple(_EXTENSION_INTERPRETERS)
+# Interpreter name -> (executables to try on PATH, arguments placed before the script).
+# PowerShell 7 starts noticeably faster than Windows PowerShell 5, so it is tried first.
+_INTERPRETER_COMMANDS: Mapping[str, tuple[tuple[str, ...], tuple[str, ...]]] = MappingProxyType(
+    {
+        "Bash": (("bash",), ()),
+        "PowerShell": (("pwsh", "powershell"), ("-ExecutionPolicy", "Bypass", "-File")),
+        "Node.js": (("node",), ()),
+    }
+)
+
+
+@contextmanager
+def _signals_blocked(widget: QWidget) -> Iterator[None]:
+    """Block a widget's signals for the duration of the block, even on error."""
+    previous = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(previous)
+
+
+# ASCII characters that make shlex tokenization differ from str.split(): quoting,
+# and the control characters str.split() treats as whitespace but shlex does not.
+_SHELL_QUOTING = frozenset("\"'\\\x0b\x0c\x1c\x1d\x1e\x1f")
+
+
+@functools.lru_cache(maxsize=32)
+def _split_arguments(text: str) -> tuple[str, ...]:
+    # Validation and the next run usually parse the same text, so parse it once.
+    if text.isascii() and _SHELL_QUOTING.isdisjoint(text):
+        return tuple(text.split())
+    return tuple(shlex.split(text, posix=(os.name != "nt")))
+
+
+@functools.lru_cache(maxsize=None)
+def _which(*names: str) -> str:
+    """Resolve the first of ``names`` found on PATH, once per process.
+
+    Falls back to the bare first name so QProcess can still search PATH itself.
+    """
+    for name in names:
+        found = shutil.which(name)
+        if found:
+            return found
+    return names[0]
+
+
+def _split_long_lines(text: str) -> str:
+    if len(text) <= OUTPUT_MAX_LINE_CHARS or not _OVERLONG_LINE_RE.search(text):
+        return text
+    limit = OUTPUT_MAX_LINE_CHARS
+    return "\n".join(
+        line[start:start + limit] for line in text.split("\n") for start in range(0, len(line) or 1, limit)
+    )
+
+
+def _shebang_interpreter(head: str) -> Optional[str]:
+    for needle, interpreter in _SHEBANG_INTERPRETERS:
+        if needle in head:
+            return interpreter
+    if "powershell" in head.lower():
+        return "PowerShell"
+    return None
 
 
 def _timestamp() -> str:
@@ -79,23 +205,26 @@ def _timestamp() -> str:
 
 
 def _with_timestamp(text: str) -> str:
-    stamp = dt.datetime.now().strftime("[%H:%M:%S] ")
+    stamp = time.strftime("[%H:%M:%S] ")
     lines = text.splitlines() or [""]
     return "\n".join(f"{stamp}{line}" for line in lines)
 
 
-def _classify_log(path: str) -> str:
-    tags = {"error": ["error", "exception", "traceback"], "warning": ["warning"], "success": ["success", "done"]}
-    try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as handle:
-            head = handle.read(4096).lower()
-    except OSError:
-        return "other"
+def _history_entry(path: str, timestamp: str, arguments: str) -> Dict[str, str]:
+    # Underscore keys are derived once per entry and never persisted.
+    basename = os.path.basename(path)
+    return {
+        "path": path,
+        "timestamp": timestamp,
+        "arguments": arguments,
+        "_basename": basename,
+        "_basename_lower": basename.lower(),
+        "_path_lower": path.lower(),
+    }
+
 
-    for label, needles in tags.items():
-        if any(needle in head for needle in needles):
-            return label
-    return "other"
+def _persisted_history(history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    return [{key: value for key, value in entry.items() if not key.startswith("_")} for entry in history]
 
 
 def _normalize_history(history: List) -> List[Dict[str, str]]:
@@ -103,14 +232,14 @@ def _normalize_history(history: List) -> List[Dict[str, str]]:
     for entry in history:
         if isinstance(entry, dict):
             normalised.append(
-                {
-                    "path": entry.get("path", ""),
-                    "timestamp": entry.get("timestamp", _timestamp()),
-                    "arguments": entry.get("arguments", ""),
-                }
+                _history_entry(
+                    entry.get("path", ""),
+                    entry.get("timestamp", _timestamp()),
+                    entry.get("arguments", ""),
+                )
             )
         elif isinstance(entry, str):
-            normalised.append({"path": entry, "timestamp": _timestamp(), "arguments": ""})
+            normalised.append(_history_entry(entry, _timestamp(), ""))
     return [item for item in normalised if item["path"]]
 
 
@@ -120,35 +249,87 @@ class ScriptRunnerWindow(QWidget):
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Script Runner")
-        self.setWindowIcon(QIcon(resource_path("app_icon.ico")))
+        # Windows inherit the application icon; only load it here when run() did not.
+        if QApplication.windowIcon().isNull():
+            self.setWindowIcon(QIcon(resource_path("app_icon.ico")))
         self.setAcceptDrops(True)
 
         self.config = load_config()
         self.history = _normalize_history(self.config.get("history", []))
         stored_args = [arg for arg in self.config.get("argument_suggestions", []) if isinstance(arg, str)]
         self.argument_bank = list(dict.fromkeys(COMMON_ARGUMENTS + stored_args))
+        self._argument_bank_set = set(self.argument_bank)
         self.profiles = [
             InterpreterProfile.from_dict(data) for data in self.config.get("interpreter_profiles", [])
         ]
 
         self.script_path: Optional[str] = None
+        # Name parts of script_path, split once whenever it changes.
+        self._script_name = ""
+        self._script_ext = ""
+        # File-name stem for saved logs.
+        self._log_base = "output"
+        self._autorun_candidate: Optional[str] = None
         self.local_python: Optional[str] = None
-        self.process = ScriptProcess(self)
-        self.process.output_ready.connect(partial(self._append_output, stamp=False))
-        self.process.error.connect(self._handle_process_error)
-        self.process.finished.connect(self._process_finished)
+        # Process output is queued and written to the console at most ~30 times a second.
+        self._pending_output: List[str] = []
+        # Script output may stop mid-line (prompts, progress bars); status messages
+        # then start on a fresh line instead of continuing it.
+        self._output_at_line_start = True
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(OUTPUT_FLUSH_INTERVAL_MS)
+        self._output_flush_timer.timeout.connect(self._flush_output)
+
+        self.process: Optional[ScriptProcess] = None
+        self._ensure_process()
 
         self._terminated_by_user = False
-        self._log_cache: Dict[str, str] = {}
-        self._current_stylesheet = ""
+        # Log classification keyed by path, valid while (mtime, size) match.
+        self._log_cache: Dict[str, tuple[float, int, str]] = {}
+        self._log_scan_pending = False
+        # Directory listing reused by _refresh_logs until the log directory changes.
+        self._log_listing: Optional[tuple[int, List[tuple[str, str, float, int]]]] = None
+        # Saved log that keeps receiving console output, and output queued while it is first written.
+        self._live_log: Optional[TextIO] = None
+        self._live_log_backlog: Optional[List[str]] = None
+        # Path of the save in flight; a console reset clears it so a late result is not reused.
+        self._log_save_path: Optional[str] = None
+        self._applied_theme: Optional[str] = None
+
+        # Config changes are written once per burst instead of once per action.
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(CONFIG_FLUSH_DELAY_MS)
+        self._config_flush_timer.timeout.connect(self._flush_config_now)
+
+        self._live_log_flush_timer = QTimer(self)
+        self._live_log_flush_timer.setSingleShot(True)
+        self._live_log_flush_timer.setInterval(LIVE_LOG_FLUSH_INTERVAL_MS)
+        self._live_log_flush_timer.timeout.connect(self._flush_live_log)
+
+        # Changes to the log directory refresh the list once they settle.
+        self._log_watch_timer = QTimer(self)
+        self._log_watch_timer.setSingleShot(True)
+        self._log_watch_timer.setInterval(LOG_WATCH_DELAY_MS)
+        # Files the app wrote itself are already in the cached listing, so the
+        # directory mtime check turns those notifications into no-ops.
+        self._log_watch_timer.timeout.connect(lambda: self._refresh_logs())
+        self._log_watcher = QFileSystemWatcher(self)
+        self._log_watcher.directoryChanged.connect(lambda _path: self._log_watch_timer.start())
+        self._watch_log_dir()
 
         self._build_ui()
         self.apply_theme(self.config.get("theme", "dark"))
-        self._refresh_history()
-        self._refresh_logs()
         self._refresh_templates()
         self._apply_profiles()
         self._bind_shortcuts()
+        # The side lists fill on the first event-loop pass, so the window paints first.
+        QTimer.singleShot(0, self._populate_lists)
+
+    def _populate_lists(self) -> None:
+        self._refresh_history()
+        self._refresh_logs()
 
         # UI layout and widgets
     def _build_ui(self) -> None:
@@ -172,8 +353,13 @@ class ScriptRunnerWindow(QWidget):
         self.browse_btn = self._make_button("Browse", self.browse_script)
         header_layout.addWidget(self.browse_btn)
 
+        # One prebuilt model per interpreter; switching interpreters swaps models.
+        self._template_models = {
+            name: self._build_template_model(entries) for name, entries in COMMAND_TEMPLATES.items()
+        }
+        self._empty_template_model = self._build_template_model(())
         self.template_box = QComboBox()
-        self.template_box.addItem("Insert Template…")
+        self.template_box.setModel(self._empty_template_model)
         self.template_box.currentIndexChanged.connect(self._apply_template)
         header_layout.addWidget(self.template_box)
 
@@ -219,12 +405,24 @@ class ScriptRunnerWindow(QWidget):
 
         self.history_search = QLineEdit()
         self.history_search.setPlaceholderText("Search history…")
-        self.history_search.textChanged.connect(self._filter_history)
+        self.history_search.textChanged.connect(self._schedule_history_filter)
         history_layout.addWidget(self.history_search)
 
-        self.history_list = QListWidget()
+        self._history_filter_timer = QTimer(self)
+        self._history_filter_timer.setSingleShot(True)
+        self._history_filter_timer.setInterval(HISTORY_FILTER_DELAY_MS)
+        self._history_filter_timer.timeout.connect(self._filter_history)
+
+        # Views only materialize visible rows; data is read from the models.
+        self.history_model = HistoryModel(self)
+        self.history_proxy = HistoryFilterModel(self)
+        self.history_proxy.setSourceModel(self.history_model)
+        self.history_list = QListView()
         self.history_list.setObjectName("historyList")
-        self.history_list.itemDoubleClicked.connect(self._load_history_entry)
+        self.history_list.setModel(self.history_proxy)
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setEditTriggers(QListView.NoEditTriggers)
+        self.history_list.doubleClicked.connect(self._load_history_entry)
         self.history_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.history_list.customContextMenuRequested.connect(self._history_context_menu)
         history_layout.addWidget(self.history_list, 1)
@@ -252,9 +450,13 @@ class ScriptRunnerWindow(QWidget):
         self.log_filter.currentIndexChanged.connect(lambda _: self._refresh_logs())
         logs_layout.addWidget(self.log_filter)
 
-        self.logs_list = QListWidget()
+        self.logs_model = LogModel(self)
+        self.logs_list = QListView()
         self.logs_list.setObjectName("logsList")
-        self.logs_list.itemDoubleClicked.connect(self._open_log)
+        self.logs_list.setModel(self.logs_model)
+        self.logs_list.setUniformItemSizes(True)
+        self.logs_list.setEditTriggers(QListView.NoEditTriggers)
+        self.logs_list.doubleClicked.connect(self._open_log)
         self.logs_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.logs_list.customContextMenuRequested.connect(self._logs_context_menu)
         logs_layout.addWidget(self.logs_list, 1)
@@ -312,10 +514,17 @@ class ScriptRunnerWindow(QWidget):
         self.arg_input = QLineEdit()
         self.arg_input.setObjectName("argInput")
         self.arg_input.setPlaceholderText("Flags or parameters for your script")
-        self.arg_input.textChanged.connect(self._validate_arguments)
+        self.arg_input.textChanged.connect(self._schedule_argument_validation)
         controls_layout.addWidget(self.arg_input, 2, 1)
 
-        self.arg_completer = QCompleter(self.argument_bank, self)
+        self._arg_error_state = False
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(ARGUMENT_VALIDATION_DELAY_MS)
+        self._validate_timer.timeout.connect(self._validate_arguments)
+
+        self._arg_model = QStringListModel(self.argument_bank, self)
+        self.arg_completer = QCompleter(self._arg_model, self)
         self.arg_completer.setCaseSensitivity(Qt.CaseInsensitive)
         self.arg_completer.setCompletionMode(QCompleter.PopupCompletion)
         self.arg_input.setCompleter(self.arg_completer)
@@ -337,7 +546,14 @@ class ScriptRunnerWindow(QWidget):
         self.output_box.setObjectName("outputBox")
         self.output_box.setReadOnly(True)
         self.output_box.setFont(QFont("Cascadia Mono", 11))
+        # Oldest lines are dropped once the console exceeds the cap; 0 disables it.
+        max_lines = self.config.get("max_output_lines")
+        # type() rather than isinstance(): JSON true/false must not count as 1/0.
+        if type(max_lines) is not int or max_lines < 0:
+            max_lines = OUTPUT_MAX_BLOCKS
+        self.output_box.document().setMaximumBlockCount(max_lines)
         self.highlighter = LogHighlighter(self.output_box.document())
+        self._output_cursor = QTextCursor(self.output_box.document())
         output_layout.addWidget(self.output_box, 1)
 
         console_row = QHBoxLayout()
@@ -404,15 +620,31 @@ class ScriptRunnerWindow(QWidget):
 
     # Theme styling
     def apply_theme(self, theme: str) -> None:
-        stylesheet = build_stylesheet(theme if theme in ("dark", "light") else "dark")
-        self._current_stylesheet = stylesheet
-        self.setStyleSheet(stylesheet)
+        theme = theme if theme in ("dark", "light") else "dark"
+        # Re-applying the same theme would still restyle every widget.
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+        # One application-wide sheet is parsed once and shared by the window and its dialogs.
+        app = QApplication.instance()
+        (app or self).setStyleSheet(build_stylesheet(theme))
+
+    # Config persistence
+    def _mark_config_dirty(self) -> None:
+        self._config_flush_timer.start()
+
+    def _flush_config_now(self) -> None:
+        self._config_flush_timer.stop()
+        save_config({**self.config, "history": _persisted_history(self.history)})
+
+    def closeEvent(self, event) -> None:
+        self._flush_config_now()
+        self._close_live_log()
+        super().closeEvent(event)
 
     # Configuration dialogs
     def open_settings(self) -> None:
         dialog = SettingsDialog(self.config, self)
-        if self._current_stylesheet:
-            dialog.setStyleSheet(self._current_stylesheet)
         if not dialog.exec():
             return
         updates, actions = dialog.result_config()
@@ -420,7 +652,7 @@ class ScriptRunnerWindow(QWidget):
         self.profiles = [InterpreterProfile.from_dict(data) for data in self.config.get("interpreter_profiles", [])]
         self.apply_theme(self.config["theme"])
         self._apply_profiles()
-        save_config(self.config)
+        self._mark_config_dirty()
         if actions.get("clear_history"):
             self._clear_history_entries()
         if actions.get("clear_logs"):
@@ -437,15 +669,23 @@ class ScriptRunnerWindow(QWidget):
             event.acceptProposedAction()
 
     def dropEvent(self, event) -> None:
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path.endswith((".py", ".sh", ".ps1", ".js", ".bat")):
-                self.load_script(path)
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        paths = [path for path in paths if path.endswith(SCRIPT_EXTENSIONS)]
+        if not paths:
+            return
+        # Only the last drop ends up loaded, so the others just go into history.
+        *earlier, last = paths
+        if earlier:
+            self._remember_history(*earlier)
+        self.load_script(last)
 
     def load_script(self, path: str) -> None:
         self.script_path = path
-        self.script_label.setText(f"Script: {os.path.basename(path)}")
-        interpreter = self._detect_interpreter(path)
+        self._script_name = os.path.basename(path)
+        self._log_base, ext = os.path.splitext(self._script_name)
+        self._script_ext = ext.lower()
+        self.script_label.setText(f"Script: {self._script_name}")
+        interpreter = self._detect_interpreter(path, self._script_ext)
         if interpreter:
             index = self.interpreter_box.findText(interpreter)
             if index >= 0:
@@ -453,25 +693,16 @@ class ScriptRunnerWindow(QWidget):
         self.local_python = self._locate_local_python(path)
         self._remember_history(path)
 
-    def _detect_interpreter(self, path: str) -> Optional[str]:
-        ext = os.path.splitext(path)[1].lower()
-        mapping = {".py": "Python", ".sh": "Bash", ".ps1": "PowerShell", ".js": "Node.js", ".bat": "Bash"}
-        if ext in mapping:
-            return mapping[ext]
+    def _detect_interpreter(self, path: str, ext: str) -> Optional[str]:
+        interpreter = _EXTENSION_INTERPRETERS.get(ext)
+        if interpreter:
+            return interpreter
         try:
             with open(path, "r", encoding="utf-8", errors="ignore") as handle:
                 head = handle.readline()
         except OSError:
             return None
-        if "python" in head:
-            return "Python"
-        if "node" in head:
-            return "Node.js"
-        if "bash" in head or "sh" in head:
-            return "Bash"
-        if "powershell" in head.lower():
-            return "PowerShell"
-        return None
+        return _shebang_interpreter(head)
 
         # Script execution
     def run_script(self) -> None:
@@ -482,16 +713,17 @@ class ScriptRunnerWindow(QWidget):
             self._append_output("> No script selected.", stamp=True)
             return
         try:
-            args = shlex.split(self.arg_input.text(), posix=(os.name != "nt")) if self.arg_input.text() else []
+            args = list(_split_arguments(self.arg_input.text()))
         except ValueError as error:
             self._append_output(f"> Argument parsing error: {error}", stamp=True)
             return
         for argument in args:
-            if argument not in self.argument_bank:
+            if argument not in self._argument_bank_set:
                 self.argument_bank.append(argument)
-        dynamic = [item for item in self.argument_bank if item not in COMMON_ARGUMENTS]
+                self._argument_bank_set.add(argument)
+        dynamic = [item for item in self.argument_bank if item not in _COMMON_ARGUMENT_SET]
         self.config["argument_suggestions"] = dynamic[-60:]
-        save_config(self.config)
+        self._mark_config_dirty()
         self._update_completer()
 
         interpreter = self.interpreter_box.currentText()
@@ -502,9 +734,9 @@ class ScriptRunnerWindow(QWidget):
             self._launch_external(program, arguments)
             return
 
-        self.output_box.clear()
+        self._reset_console()
         preview = " ".join(shlex.quote(part) for part in [program, *arguments])
-        self._append_output(f"> Running {os.path.basename(self.script_path)}", stamp=True)
+        self._append_output(f"> Running {self._script_name}", stamp=True)
         self._append_output(f"> {preview}", stamp=True)
 
         working_dir = os.path.dirname(self.script_path)
@@ -516,15 +748,14 @@ class ScriptRunnerWindow(QWidget):
         profile = next((p for p in self.profiles if p.name == self.profile_box.currentText()), None)
         if profile and profile.command:
             return profile.command, list(profile.arguments)
-        if name == "Python" and self.local_python:
-            return self.local_python, []
-        default_map = {
-            "Python": (self._python_exec(), []),
-            "Bash": ("bash", []),
-            "PowerShell": ("powershell", ["-ExecutionPolicy", "Bypass", "-File"]),
-            "Node.js": ("node", []),
-        }
-        return default_map.get(name, ("python", []))
+        if name == "Python":
+            # -u stops the child block-buffering its piped stdout, so output streams live.
+            return self.local_python or self._python_exec(), ["-u"]
+        command = _INTERPRETER_COMMANDS.get(name)
+        if command is None:
+            return "python", []
+        executables, arguments = command
+        return _which(*executables), list(arguments)
 
     def _python_exec(self) -> str:
         env_override = os.environ.get("SCRIPT_RUNNER_PYTHON")
@@ -551,15 +782,21 @@ class ScriptRunnerWindow(QWidget):
         if not script_path:
             return None
         directory = os.path.abspath(os.path.dirname(script_path))
-        candidates = [".venv", "venv", "env"]
+        candidates = (".venv", "venv", "env")
+        if sys.platform.startswith("win"):
+            relative_python = os.path.join("Scripts", "python.exe")
+        else:
+            relative_python = os.path.join("bin", "python")
         while True:
+            # One directory read per level instead of a stat per candidate.
+            try:
+                with os.scandir(directory) as entries:
+                    found = {entry.name: entry.path for entry in entries if entry.name in candidates}
+            except OSError:
+                found = {}
             for name in candidates:
-                candidate_dir = os.path.join(directory, name)
-                if os.path.isdir(candidate_dir):
-                    if sys.platform.startswith("win"):
-                        python_path = os.path.join(candidate_dir, "Scripts", "python.exe")
-                    else:
-                        python_path = os.path.join(candidate_dir, "bin", "python")
+                if name in found:
+                    python_path = os.path.join(found[name], relative_python)
                     if os.path.isfile(python_path):
                         return python_path
             new_directory = os.path.dirname(directory)
@@ -579,6 +816,15 @@ class ScriptRunnerWindow(QWidget):
             self._append_output(f"> Failed to launch external console: {error}", stamp=True)
             self.status_label.setText("Launch failed")
 
+    def _ensure_process(self) -> None:
+        # One ScriptProcess is reused for every run; start() resets its state.
+        if self.process is not None:
+            return
+        self.process = ScriptProcess(self)
+        self.process.output_ready.connect(self._queue_output)
+        self.process.error.connect(self._handle_process_error)
+        self.process.finished.connect(self._process_finished)
+
     def stop_script(self) -> None:
         if not self.process.is_running():
             self._append_output("> There is no running script.", stamp=True)
@@ -608,15 +854,10 @@ class ScriptRunnerWindow(QWidget):
         self.send_btn.setEnabled(running)
         self.status_label.setText("Running" if running else self._ready_status())
         if not running:
+            # A finished run's output reaches the live log now, not when the buffer fills.
+            self._flush_live_log()
             self.console_input.clear()
-            old_process = self.process
-            self.process = ScriptProcess(self)
-            self.process.output_ready.connect(partial(self._append_output, stamp=False))
-            self.process.error.connect(self._handle_process_error)
-            self.process.finished.connect(self._process_finished)
             self._terminated_by_user = False
-            if old_process is not None:
-                old_process.deleteLater()
 
     def send_console_input(self) -> None:
         text = self.console_input.text()
@@ -629,48 +870,49 @@ class ScriptRunnerWindow(QWidget):
         display = f"$ {text}" if text else "$"
         self._append_output(display, stamp=True)
         self.process.write(f"{text}\n")
-        if text and text not in self.argument_bank:
+        if text and text not in self._argument_bank_set:
             self.argument_bank.append(text)
-            dynamic = [item for item in self.argument_bank if item not in COMMON_ARGUMENTS]
+            self._argument_bank_set.add(text)
+            dynamic = [item for item in self.argument_bank if item not in _COMMON_ARGUMENT_SET]
             self.config["argument_suggestions"] = dynamic[-60:]
-            save_config(self.config)
+            self._mark_config_dirty()
             self._update_completer()
         self.console_input.clear()
 
     def clear_output(self) -> None:
-        self.output_box.clear()
+        self._reset_console()
         self.status_label.setText("Console cleared")
 
+    def _reset_console(self) -> None:
+        self._close_live_log()
+        self.output_box.clear()
+        self._output_at_line_start = True
+
         # History tracking
-    def _remember_history(self, path: str) -> None:
-        entry = {"path": path, "timestamp": _timestamp(), "arguments": self.arg_input.text()}
-        self.history = [item for item in self.history if item["path"] != path]
-        self.history.insert(0, entry)
-        self.history = self.history[:40]
+    def _remember_history(self, *paths: str) -> None:
+        # The last path is the most recent; duplicates keep their latest position.
+        recent = list(dict.fromkeys(reversed(paths)))
+        timestamp = _timestamp()
+        arguments = self.arg_input.text()
+        seen = set(recent)
+        entries = [_history_entry(path, timestamp, arguments) for path in recent]
+        self.history = (entries + [item for item in self.history if item["path"] not in seen])[:40]
         self.config["history"] = self.history
-        save_config(self.config)
+        self._mark_config_dirty()
         self._refresh_history()
 
     def _refresh_history(self) -> None:
-        query = self.history_search.text().lower()
-        self.history_list.clear()
-        for item in self.history:
-            text = f'{item["timestamp"]}  |  {os.path.basename(item["path"])}'
-            widget = QListWidgetItem(text)
-            widget.setData(Qt.UserRole, item)
-            match = query in text.lower() or query in item["path"].lower()
-            self.history_list.addItem(widget)
-            widget.setHidden(bool(query) and not match)
-
-    def _filter_history(self, text: str) -> None:
-        self._refresh_history()
-        for index in range(self.history_list.count()):
-            item = self.history_list.item(index)
-            match = text.lower() in (item.data(Qt.UserRole)["path"].lower())
-            item.setHidden(not match)
+        self.history_model.set_entries(self.history)
+
+    def _schedule_history_filter(self, _text: str) -> None:
+        # Restarting the timer coalesces a burst of keystrokes into one pass.
+        self._history_filter_timer.start()
+
+    def _filter_history(self) -> None:
+        self.history_proxy.set_query(self.history_search.text())
 
-    def _load_history_entry(self, item: QListWidgetItem) -> None:
-        data = item.data(Qt.UserRole)
+    def _load_history_entry(self, index: QModelIndex) -> None:
+        data = index.data(Qt.UserRole)
         path = data["path"]
         if os.path.exists(path):
             self.load_script(path)
@@ -679,14 +921,14 @@ class ScriptRunnerWindow(QWidget):
             self._append_output(f"> File not found: {path}", stamp=True)
 
     def _open_selected_history(self) -> None:
-        item = self.history_list.currentItem()
-        if item:
-            self._load_history_entry(item)
+        index = self.history_list.currentIndex()
+        if index.isValid():
+            self._load_history_entry(index)
 
     def _history_context_menu(self, position) -> None:
-        item = self.history_list.itemAt(position)
+        index = self.history_list.indexAt(position)
         menu = QMenu(self)
-        if item:
+        if index.isValid():
             remove_action = menu.addAction("Remove entry")
             if menu.exec(self.history_list.mapToGlobal(position)) == remove_action:
                 self._delete_selected_history()
@@ -696,64 +938,133 @@ class ScriptRunnerWindow(QWidget):
                 self._clear_history_entries()
 
     def _delete_selected_history(self) -> None:
-        item = self.history_list.currentItem()
-        if not item:
+        index = self.history_list.currentIndex()
+        if not index.isValid():
             return
-        data = item.data(Qt.UserRole)
+        data = index.data(Qt.UserRole)
         self.history = [entry for entry in self.history if entry["path"] != data["path"]]
         self.config["history"] = self.history
-        save_config(self.config)
+        self._mark_config_dirty()
         self._refresh_history()
 
     def _clear_history_entries(self) -> None:
         self.history.clear()
         self.config["history"] = []
-        save_config(self.config)
+        self._mark_config_dirty()
         self._refresh_history()
 
     # Log handling
-    def _refresh_logs(self) -> None:
-        self.logs_list.clear()
+    def _refresh_logs(self, rescan: bool = False) -> None:
         filter_map = {0: None, 1: "error", 2: "warning", 3: "success"}
         active_filter = filter_map.get(self.log_filter.currentIndex())
 
-        try:
-            files = sorted(
-                (os.path.join(LOG_DIR, name) for name in os.listdir(LOG_DIR) if name.lower().endswith(".log")),
-                key=os.path.getmtime,
-                reverse=True,
-            )
-        except OSError:
-            files = []
+        files = self._list_logs(rescan)
+        stale = [
+            (path, mtime, size)
+            for path, _, mtime, size in files
+            if size and self._log_cache.get(path, (None, None))[:2] != (mtime, size)
+        ]
+        if len(stale) > LOG_SCAN_SYNC_LIMIT:
+            # Classify off the GUI thread, then refresh again from a warm cache.
+            if not self._log_scan_pending:
+                self._log_scan_pending = True
+                task = LogScanTask(stale)
+                task.signals.finished.connect(self._logs_scanned)
+                QThreadPool.globalInstance().start(task)
+            return
 
-        for full_path in files:
-            label = os.path.basename(full_path)
-            category = self._log_cache.get(full_path) or _classify_log(full_path)
-            self._log_cache[full_path] = category
+        cache: Dict[str, tuple[float, int, str]] = {}
+        rows: List[tuple[str, str]] = []
+        for path, name, mtime, size in files:
+            cached = self._log_cache.get(path)
+            if cached and cached[0] == mtime and cached[1] == size:
+                category = cached[2]
+            elif size == 0:
+                category = "other"
+            else:
+                category = classify_log(path)
+            cache[path] = (mtime, size, category)
             if active_filter and category != active_filter:
                 continue
-            display = f"{label}  •  {category.upper()}"
-            item = QListWidgetItem(display)
-            item.setData(Qt.UserRole, full_path)
-            self.logs_list.addItem(item)
+            rows.append((path, f"{name}  •  {category.upper()}"))
+        self.logs_model.set_logs(rows)
+        # Rebuilding the cache from the current listing drops deleted files.
+        self._log_cache = cache
+
+    def _watch_log_dir(self) -> None:
+        # The directory only exists after the first save, so this is retried from save_log.
+        if not self._log_watcher.directories() and os.path.isdir(LOG_DIR):
+            self._log_watcher.addPath(LOG_DIR)
+
+    def _add_to_log_listing(self, path: str) -> None:
+        """Put a log the app just wrote at the top of the cached listing instead of rescanning."""
+        if self._log_listing is None:
+            return
+        try:
+            stat = os.stat(path)
+            dir_mtime = os.stat(LOG_DIR).st_mtime_ns
+        except OSError:
+            self._log_listing = None
+            return
+        _, listing = self._log_listing
+        entry = (path, os.path.basename(path), stat.st_mtime, stat.st_size)
+        self._log_listing = (dir_mtime, [entry, *(item for item in listing if item[0] != path)])
 
-    def _open_log(self, item: QListWidgetItem) -> None:
-        path = item.data(Qt.UserRole)
+    def _list_logs(self, rescan: bool = False) -> List[tuple[str, str, float, int]]:
+        """Return ``(path, name, mtime, size)`` for saved logs, newest first.
+
+        The listing is reused while the log directory's mtime is unchanged, which
+        covers files being created, renamed or removed. Pass ``rescan`` after
+        modifying a log in place.
+        """
+        try:
+            dir_mtime = os.stat(LOG_DIR).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if not rescan and dir_mtime is not None and self._log_listing is not None:
+            cached_mtime, listing = self._log_listing
+            if cached_mtime == dir_mtime:
+                return listing
+
+        files: List[tuple[str, str, float, int]] = []
+        try:
+            with os.scandir(LOG_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(LOG_SUFFIXES):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        files.append((entry.path, entry.name, stat.st_mtime, stat.st_size))
+        except OSError:
+            pass
+        files.sort(key=lambda item: item[2], reverse=True)
+        self._log_listing = None if dir_mtime is None else (dir_mtime, files)
+        return files
+
+    def _logs_scanned(self, results: List[tuple[str, float, int, str]]) -> None:
+        self._log_scan_pending = False
+        for path, mtime, size, category in results:
+            self._log_cache[path] = (mtime, size, category)
+        self._refresh_logs()
+
+    def _open_log(self, index: QModelIndex) -> None:
+        path = index.data(Qt.UserRole)
         if path:
             QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def _open_selected_log(self) -> None:
-        item = self.logs_list.currentItem()
-        if not item:
+        index = self.logs_list.currentIndex()
+        if not index.isValid():
             return
-        path = item.data(Qt.UserRole)
+        path = index.data(Qt.UserRole)
         if path:
             QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def _logs_context_menu(self, position) -> None:
-        item = self.logs_list.itemAt(position)
+        index = self.logs_list.indexAt(position)
         menu = QMenu(self)
-        if item:
+        if index.isValid():
             delete_action = menu.addAction("Delete log")
             if menu.exec(self.logs_list.mapToGlobal(position)) == delete_action:
                 self._delete_selected_log()
@@ -763,10 +1074,14 @@ class ScriptRunnerWindow(QWidget):
                 self._clear_all_logs()
 
     def _delete_selected_log(self) -> None:
-        item = self.logs_list.currentItem()
-        if not item:
+        index = self.logs_list.currentIndex()
+        if not index.isValid():
             return
-        path = item.data(Qt.UserRole)
+        path = index.data(Qt.UserRole)
+        live = self._live_log
+        if path and live is not None and os.path.normcase(live.name) == os.path.normcase(path):
+            # Stop teeing first; Windows refuses to delete an open file.
+            self._close_live_log()
         if path and os.path.exists(path):
             try:
                 os.remove(path)
@@ -775,42 +1090,146 @@ class ScriptRunnerWindow(QWidget):
         self._refresh_logs()
 
     def _clear_all_logs(self) -> None:
-        for entry in os.listdir(LOG_DIR):
-            full_path = os.path.join(LOG_DIR, entry)
-            if entry.lower().endswith(".log") and os.path.isfile(full_path):
-                try:
-                    os.remove(full_path)
-                except OSError:
-                    pass
+        self._close_live_log()
+        try:
+            with os.scandir(LOG_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(LOG_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
         self._refresh_logs()
 
     def save_log(self) -> None:
-        if not self.output_box.toPlainText().strip():
+        if self._live_log is not None:
+            # Output since the first save has been streamed; just push it to disk.
+            try:
+                self._live_log.flush()
+            except OSError as error:
+                self._append_output(f"> Failed to save log: {error}", stamp=True)
+                self._close_live_log()
+                return
+            self._append_output(
+                f"> Log updated at {self._live_log.name}; further output is appended to it until the next run or Clear",
+                stamp=True,
+            )
+            # Appending does not touch the directory, so force a fresh listing.
+            self._refresh_logs(rescan=True)
+            return
+        if self._live_log_backlog is not None:
+            return
+        # isEmpty() answers the common empty case without materializing the text.
+        text = "" if self.output_box.document().isEmpty() else self.output_box.toPlainText()
+        # isspace() checks in place; strip() would copy the whole console text.
+        if not text or text.isspace():
             self._append_output("> Nothing to save yet.", stamp=True)
             return
-        timestamp = dt.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        base = os.path.splitext(os.path.basename(self.script_path or "output"))[0]
-        filename = f"{base}_{timestamp}.log"
-        path = os.path.join(LOG_DIR, filename)
         try:
-            with open(path, "w", encoding="utf-8") as handle:
-                handle.write(self.output_box.toPlainText())
-            self._append_output(f"> Log saved to {path}", stamp=True)
-            self._refresh_logs()
+            ensure_dirs()
         except OSError as error:
             self._append_output(f"> Failed to save log: {error}", stamp=True)
+            return
+        self._watch_log_dir()
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        path = f"{LOG_DIR}{os.sep}{self._log_base}_{timestamp}.log"
+        # The text is captured here; only the disk write runs on the pool.
+        # Output arriving meanwhile is held back and appended once the file exists.
+        self._live_log_backlog = []
+        self._log_save_path = path
+        task = LogWriteTask(path, text)
+        task.signals.finished.connect(self._log_saved)
+        task.signals.failed.connect(self._log_save_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _log_saved(self, path: str) -> None:
+        if path != self._log_save_path:
+            # The console was reset while writing, so the file must not receive the new output.
+            self._append_output(f"> Log saved to {path}", stamp=True)
+            self._add_to_log_listing(path)
+            self._refresh_logs()
+            return
+        self._log_save_path = None
+        backlog, self._live_log_backlog = self._live_log_backlog or [], None
+        handle = None
+        try:
+            handle = open(path, "a", encoding="utf-8", buffering=LIVE_LOG_BUFFER_SIZE)
+            handle.writelines(backlog)
+        except OSError:
+            if handle is not None:
+                handle.close()
+            handle = None
+        if handle is not None:
+            self._append_output(
+                f"> Log saved to {path}; further output is appended to it until the next run or Clear", stamp=True
+            )
+        else:
+            self._append_output(f"> Log saved to {path}", stamp=True)
+        # Later console output streams into the same file until the console is reset.
+        self._live_log = handle
+        self._add_to_log_listing(path)
+        self._refresh_logs()
+
+    def _log_save_failed(self, path: str, message: str) -> None:
+        if path == self._log_save_path:
+            self._log_save_path = None
+            self._live_log_backlog = None
+        self._append_output(f"> Failed to save log: {message}", stamp=True)
+
+    def _tee_output(self, payload: str) -> None:
+        if self._live_log is not None:
+            try:
+                self._live_log.write(payload)
+            except OSError:
+                self._close_live_log()
+                return
+            if not self._live_log_flush_timer.isActive():
+                self._live_log_flush_timer.start()
+        elif self._live_log_backlog is not None:
+            self._live_log_backlog.append(payload)
+
+    def _flush_live_log(self) -> None:
+        self._live_log_flush_timer.stop()
+        if self._live_log is None:
+            return
+        try:
+            self._live_log.flush()
+        except OSError:
+            self._close_live_log()
+
+    def _close_live_log(self) -> None:
+        self._live_log_flush_timer.stop()
+        self._live_log_backlog = None
+        self._log_save_path = None
+        if self._live_log is None:
+            return
+        try:
+            self._live_log.close()
+        except OSError:
+            pass
+        self._live_log = None
 
         # Templates and interpreter profiles
     def _refresh_templates(self) -> None:
-        current = self.template_box.currentText()
         interpreter = self.interpreter_box.currentText()
-        self.template_box.blockSignals(True)
-        self.template_box.clear()
-        self.template_box.addItem("Insert Template…")
-        for label, snippet in COMMAND_TEMPLATES.get(interpreter, []):
-            self.template_box.addItem(label, snippet)
-        self.template_box.setCurrentIndex(0)
-        self.template_box.blockSignals(False)
+        model = self._template_models.get(interpreter, self._empty_template_model)
+        if self.template_box.model() is model:
+            return
+        with _signals_blocked(self.template_box):
+            self.template_box.setModel(model)
+            self.template_box.setCurrentIndex(0)
+
+    def _build_template_model(self, entries: tuple[tuple[str, str], ...]) -> QStandardItemModel:
+        # Parented to the window so QComboBox.setModel never deletes a swapped-out model.
+        model = QStandardItemModel(self)
+        model.appendRow(QStandardItem("Insert Template…"))
+        for label, snippet in entries:
+            item = QStandardItem(label)
+            item.setData(snippet, Qt.UserRole)
+            model.appendRow(item)
+        return model
 
     def _apply_template(self, index: int) -> None:
         if index <= 0:
@@ -821,12 +1240,9 @@ class ScriptRunnerWindow(QWidget):
         self.template_box.setCurrentIndex(0)
 
     def _apply_profiles(self) -> None:
-        self.profile_box.blockSignals(True)
-        self.profile_box.clear()
-        self.profile_box.addItem("Default")
-        for profile in self.profiles:
-            self.profile_box.addItem(profile.name)
-        self.profile_box.blockSignals(False)
+        with _signals_blocked(self.profile_box):
+            self.profile_box.clear()
+            self.profile_box.addItems(["Default", *(profile.name for profile in self.profiles)])
         active = self.config.get("active_profile")
         if active:
             index = self.profile_box.findText(active)
@@ -837,40 +1253,84 @@ class ScriptRunnerWindow(QWidget):
 
     def _profile_changed(self, index: int) -> None:
         name = self.profile_box.itemText(index)
-        if name == "Default":
-            self.config["active_profile"] = None
-        else:
-            self.config["active_profile"] = name
-        save_config(self.config)
+        active = None if name == "Default" else name
+        if self.config.get("active_profile") == active:
+            return
+        self.config["active_profile"] = active
+        self._mark_config_dirty()
 
         # Argument helpers
     def _update_completer(self) -> None:
-        model = QStringListModel(self.argument_bank)
-        self.arg_completer.setModel(model)
+        # Updating in place keeps the completer and its popup wiring intact.
+        self._arg_model.setStringList(self.argument_bank)
 
-    def _validate_arguments(self, text: str) -> None:
-        if not text:
-            self.arg_input.setProperty("error", False)
-            self.arg_input.style().unpolish(self.arg_input)
-            self.arg_input.style().polish(self.arg_input)
+    def _schedule_argument_validation(self, _text: str) -> None:
+        # Validation runs once the user pauses typing.
+        self._validate_timer.start()
+
+    def _validate_arguments(self) -> None:
+        text = self.arg_input.text()
+        error = False
+        if text:
+            try:
+                _split_arguments(text)
+            except ValueError:
+                error = True
+        # Restyling invalidates the widget's style cache, so only do it on a transition.
+        if error == self._arg_error_state:
             return
-        try:
-            shlex.split(text, posix=(os.name != "nt"))
-        except ValueError:
-            self.arg_input.setStyleSheet("border: 2px solid #ff5b5b;")
-        else:
-            self.arg_input.setStyleSheet("")
+        self._arg_error_state = error
+        self.arg_input.setProperty("error", error)
+        self.arg_input.setStyleSheet("border: 2px solid #ff5b5b;" if error else "")
 
         # Output helpers
+    def _queue_output(self, text: str) -> None:
+        if not text:
+            return
+        self._pending_output.append(text)
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
+
+    def _flush_output(self) -> None:
+        self._output_flush_timer.stop()
+        if not self._pending_output:
+            return
+        payload = "".join(self._pending_output)
+        self._pending_output.clear()
+        self._write_output(payload)
+
     def _append_output(self, text: str, stamp: bool = False) -> None:
         if not text:
             return
-        payload = _with_timestamp(text) if stamp else text
-        cursor = self.output_box.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertText(payload if payload.endswith("\n") else f"{payload}\n")
-        self.output_box.setTextCursor(cursor)
-        self.output_box.ensureCursorVisible()
+        # Keep queued process output ahead of status messages.
+        self._flush_output()
+        message = _with_timestamp(text) if stamp else text
+        if not message.endswith("\n"):
+            message = f"{message}\n"
+        if not self._output_at_line_start:
+            message = f"\n{message}"
+        # Status lines describe the app, not the script, so the live log skips them.
+        self._write_output(message, tee=False)
+
+    def _write_output(self, payload: str, tee: bool = True) -> None:
+        scrollbar = self.output_box.verticalScrollBar()
+        follow = scrollbar.value() == scrollbar.maximum()
+        # One edit block with painting suspended lays the batch out once.
+        self.output_box.setUpdatesEnabled(False)
+        self._output_cursor.beginEditBlock()
+        try:
+            self._output_cursor.movePosition(QTextCursor.End)
+            self._output_cursor.insertText(_split_long_lines(payload))
+        finally:
+            self._output_cursor.endEditBlock()
+            self.output_box.setUpdatesEnabled(True)
+        self._output_at_line_start = payload.endswith("\n")
+        # The saved log keeps the original, unsplit lines.
+        if tee:
+            self._tee_output(payload)
+        # Only auto-scroll when the user has not scrolled up to read earlier output.
+        if follow:
+            scrollbar.setValue(scrollbar.maximum())
 
         # Autorun support
     def schedule_autorun(self) -> None:
@@ -882,11 +1342,17 @@ class ScriptRunnerWindow(QWidget):
         if not os.path.isfile(candidate):
             self._append_output(f"> Auto-run skipped: not a file -> {candidate}", stamp=True)
             return
+        self._autorun_candidate = candidate
+        QMetaObject.invokeMethod(self, "_autorun_trigger", Qt.QueuedConnection)
 
-        def trigger() -> None:
+    @Slot()
+    def _autorun_trigger(self) -> None:
+        candidate = self._autorun_candidate
+        if not candidate:
+            return
+        # app.run() normally loaded this script already; skip reloading it.
+        if self.script_path != candidate:
             self.load_script(candidate)
-            self.run_script()
+        self.run_script()
+
 
-        QTimer.singleShot(0, trigger)
-
-
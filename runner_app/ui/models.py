@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QSortFilterProxyModel, Qt
+
+
+class HistoryModel(QAbstractListModel):
+    """Run history backed directly by the window's list of entry dicts."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._entries: List[Dict[str, str]] = []
+        self._labels: List[str] = []
+        self._search_keys: List[tuple[str, str]] = []
+
+    def set_entries(self, entries: List[Dict[str, str]]) -> None:
+        # An identical list would only cost a relayout and drop the selection.
+        if entries == self._entries:
+            return
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._labels = [f'{entry["timestamp"]}  |  {entry["_basename"]}' for entry in self._entries]
+        # Lowercase fields are cached on the entries, so filtering never re-lowers.
+        self._search_keys = [
+            (f'{entry["timestamp"]}  |  {entry["_basename_lower"]}', entry["_path_lower"])
+            for entry in self._entries
+        ]
+        self.endResetModel()
+
+    def matches(self, row: int, query: str) -> bool:
+        label, path = self._search_keys[row]
+        return query in label or query in path
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._labels[row]
+        if role == Qt.UserRole:
+            return self._entries[row]
+        return None
+
+
+class HistoryFilterModel(QSortFilterProxyModel):
+    """Hides history rows whose label or path does not contain the query."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._query = ""
+
+    def set_query(self, text: str) -> None:
+        query = text.lower()
+        if query == self._query:
+            return
+        self._query = query
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # type: ignore[override]
+        if not self._query:
+            return True
+        model = self.sourceModel()
+        return isinstance(model, HistoryModel) and model.matches(source_row, self._query)
+
+
+class LogModel(QAbstractListModel):
+    """Saved log files as (path, display label) rows."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[tuple[str, str]] = []
+
+    def set_logs(self, rows: List[tuple[str, str]]) -> None:
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        path, label = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return label
+        if role == Qt.UserRole:
+            return path
+        return None
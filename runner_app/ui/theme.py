@@ -5,7 +5,7 @@ from typing import Literal
 ThemeName = Literal["dark", "light"]
 
 
-def build_stylesheet(theme: ThemeName) -> str:
+def _render_stylesheet(theme: ThemeName) -> str:
     if theme == "dark":
         run_color = "#00d47b"
         stop_color = "#ff5b5b"
@@ -122,19 +122,27 @@ def build_stylesheet(theme: ThemeName) -> str:
                 padding: 8px 12px;
                 color: #dcffe8;
             }}
-            QListWidget {{
+            QListWidget,
+            QListView#historyList,
+            QListView#logsList {{
                 background-color: #030b08;
                 border: 2px solid #00ff9f;
                 border-radius: 12px;
             }}
-            QListWidget::item {{
+            QListWidget::item,
+            QListView#historyList::item,
+            QListView#logsList::item {{
                 padding: 8px 10px;
                 color: #d0ffe8;
             }}
-            QListWidget::item:hover {{
+            QListWidget::item:hover,
+            QListView#historyList::item:hover,
+            QListView#logsList::item:hover {{
                 background: #093826;
             }}
-            QListWidget::item:selected {{
+            QListWidget::item:selected,
+            QListView#historyList::item:selected,
+            QListView#logsList::item:selected {{
                 background: #00ff9f;
                 color: #00140a;
             }}
@@ -287,7 +295,9 @@ def build_stylesheet(theme: ThemeName) -> str:
             QLineEdit,
             QTextEdit,
             QComboBox,
-            QListWidget {
+            QListWidget,
+            QListView#historyList,
+            QListView#logsList {
                 background-color: #ffffff;
                 border: 2px solid #14b371;
                 border-radius: 12px;
@@ -305,14 +315,20 @@ def build_stylesheet(theme: ThemeName) -> str:
                 padding: 8px 12px;
                 color: #083526;
             }
-            QListWidget::item {
+            QListWidget::item,
+            QListView#historyList::item,
+            QListView#logsList::item {
                 padding: 8px 10px;
                 color: #083526;
             }
-            QListWidget::item:hover {
+            QListWidget::item:hover,
+            QListView#historyList::item:hover,
+            QListView#logsList::item:hover {
                 background: #d8fae7;
             }
-            QListWidget::item:selected {
+            QListWidget::item:selected,
+            QListView#historyList::item:selected,
+            QListView#logsList::item:selected {
                 background: #14b371;
                 color: #ffffff;
             }
@@ -386,3 +402,11 @@ def build_stylesheet(theme: ThemeName) -> str:
                 border: none;
             }
         """
+
+
+# Both sheets are rendered once at import; callers only ever do a lookup.
+_STYLESHEETS: dict[str, str] = {"dark": _render_stylesheet("dark"), "light": _render_stylesheet("light")}
+
+
+def build_stylesheet(theme: ThemeName) -> str:
+    return _STYLESHEETS.get(theme, _STYLESHEETS["light"])
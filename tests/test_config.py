@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from runner_app import config
+
+
+class LoadConfigTests(unittest.TestCase):
+    def load(self, payload: bytes) -> dict:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.json")
+            with open(path, "wb") as handle:
+                handle.write(payload)
+            with mock.patch.object(config, "CONFIG_PATH", path):
+                return config.load_config()
+
+    def test_object_is_merged_over_defaults(self) -> None:
+        loaded = self.load(b'{"theme": "light"}')
+        self.assertEqual(loaded["theme"], "light")
+        self.assertEqual(loaded["history"], [])
+
+    def test_non_object_json_falls_back_to_defaults(self) -> None:
+        for payload in (b"[]", b"1", b'"x"', b"null"):
+            with self.subTest(payload=payload):
+                self.assertEqual(self.load(payload), dict(config.DEFAULT_CONFIG))
+
+    def test_invalid_json_falls_back_to_defaults(self) -> None:
+        self.assertEqual(self.load(b"{not json"), dict(config.DEFAULT_CONFIG))
+
+    def test_missing_file_falls_back_to_defaults(self) -> None:
+        with mock.patch.object(config, "CONFIG_PATH", os.path.join(tempfile.gettempdir(), "missing", "config.json")):
+            self.assertEqual(config.load_config(), dict(config.DEFAULT_CONFIG))
+
+
+if __name__ == "__main__":
+    unittest.main()
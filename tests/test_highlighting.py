@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+
+HAS_QT = importlib.util.find_spec("PySide6") is not None
+HAS_RE2 = importlib.util.find_spec("re2") is not None
+
+
+@unittest.skipUnless(HAS_QT, "PySide6 is not installed")
+class HighlighterPatternTests(unittest.TestCase):
+    def test_keywords_match_case_insensitively(self) -> None:
+        from runner_app.highlighting import LogHighlighter
+
+        groups = [match.lastgroup for match in LogHighlighter.PATTERN.finditer("error Warning DONE info failed")]
+        self.assertEqual(groups, ["error", "warning", "success", "info", "failure"])
+
+    @unittest.skipUnless(HAS_RE2, "google-re2 is not installed")
+    def test_pattern_compiles_with_re2(self) -> None:
+        from runner_app import highlighting
+
+        self.assertEqual(highlighting._regex.__name__, "re2")
+        match = highlighting.LogHighlighter.PATTERN.search("a traceback here")
+        self.assertIsNotNone(match)
+        self.assertEqual(match.lastgroup, "failure")
+
+
+if __name__ == "__main__":
+    unittest.main()
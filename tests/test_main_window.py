@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+
+HAS_QT = importlib.util.find_spec("PySide6") is not None
+
+
+@unittest.skipUnless(HAS_QT, "PySide6 is not installed")
+class ShebangDetectionTests(unittest.TestCase):
+    def test_interpreter_wins_over_sh_in_directory_names(self) -> None:
+        from runner_app.ui.main_window import _shebang_interpreter
+
+        cases = {
+            "#!/home/joshua/.venv/bin/python\n": "Python",
+            "#!/opt/shared/venv/bin/python3\n": "Python",
+            "#!/mnt/ssh-work/bin/python\n": "Python",
+            "#!/usr/share/nodejs/bin/node\n": "Node.js",
+            "#!/usr/bin/env bash\n": "Bash",
+            "#!/bin/sh\n": "Bash",
+            "#!/usr/bin/env PowerShell\n": "PowerShell",
+            "plain text\n": None,
+        }
+        for head, expected in cases.items():
+            with self.subTest(head=head):
+                self.assertEqual(_shebang_interpreter(head), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import re
+import unittest
+
+try:
+    from PySide6.QtCore import QCoreApplication
+except ImportError:  # pragma: no cover - tests need the Qt runtime
+    QCoreApplication = None
+
+STAMP = re.compile(r"\[\d{2}:\d{2}:\d{2}\] ")
+
+
+@unittest.skipIf(QCoreApplication is None, "PySide6 is not installed")
+class ScriptProcessOutputTests(unittest.TestCase):
+    def setUp(self) -> None:
+        from runner_app.process import ScriptProcess
+
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        self.process = ScriptProcess()
+        self.emitted: list[str] = []
+        self.process.output_ready.connect(self.emitted.append)
+
+    def feed(self, *chunks: bytes) -> str:
+        for chunk in chunks:
+            self.process._queue_text(self.process._decoder.decode(chunk))
+        self.process._flush()
+        return "".join(self.emitted)
+
+    def test_line_split_across_chunks_gets_one_timestamp(self) -> None:
+        # An unbuffered print("step", 0, "INFO") reaches the pipe as separate writes.
+        text = self.feed(b"step", b" ", b"0", b" ", b"INFO", b"\n")
+        self.assertEqual(len(STAMP.findall(text)), 1)
+        self.assertEqual(STAMP.sub("", text), "step 0 INFO\n")
+
+    def test_each_new_line_is_stamped(self) -> None:
+        text = self.feed(b"first\nsec", b"ond\nthird\n")
+        self.assertEqual(len(STAMP.findall(text)), 3)
+        self.assertEqual(STAMP.sub("", text), "first\nsecond\nthird\n")
+        self.assertTrue(all(STAMP.match(line) for line in text.splitlines()))
+
+    def test_reset_starts_a_new_line(self) -> None:
+        self.feed(b"partial")
+        self.emitted.clear()
+        self.process.reset()
+        self.assertEqual(len(STAMP.findall(self.feed(b"next\n"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()